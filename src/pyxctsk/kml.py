@@ -73,6 +73,10 @@ def _create_turnpoint_elements(
         List of coordinates for the turnpoints.
     """
     coordinates = []
+    # Styles depend only on (type, is_goal); build each once and share it
+    # between placemarks so simplekml emits a single <Style> per variant.
+    polygon_styles: dict[tuple[TurnpointType, bool], simplekml.Style] = {}
+    center_styles: dict[tuple[TurnpointType, bool], simplekml.Style] = {}
 
     for i, turnpoint in enumerate(turnpoints):
         coord = (turnpoint.waypoint.lon, turnpoint.waypoint.lat, task_altitude)
@@ -98,17 +102,25 @@ def _create_turnpoint_elements(
         # Determine if this is the goal turnpoint
         is_goal = is_goal_turnpoint(turnpoint, original_turnpoints, task)
         turnpoint_type = turnpoint.type or TurnpointType.NONE
-        circle_polygon.style = _create_turnpoint_style(turnpoint_type, is_goal)
+        style_key = (turnpoint_type, is_goal)
+        polygon_style = polygon_styles.get(style_key)
+        if polygon_style is None:
+            polygon_style = _create_turnpoint_style(turnpoint_type, is_goal)
+            polygon_styles[style_key] = polygon_style
+        circle_polygon.style = polygon_style
 
         # Add turnpoint center point
         center_point = kml.newpoint(
             name=f"{turnpoint.waypoint.name or f'TP{i + 1}'} Center",
             coords=[coord],
         )
-        center_point.style.iconstyle.scale = 0.5
-        center_point.style.iconstyle.color = _create_turnpoint_style(
-            turnpoint_type, is_goal
-        )
+        center_style = center_styles.get(style_key)
+        if center_style is None:
+            center_style = simplekml.Style()
+            center_style.iconstyle.scale = 0.5
+            center_style.iconstyle.color = polygon_style.linestyle.color
+            center_styles[style_key] = center_style
+        center_point.style = center_style
 
     return coordinates
 
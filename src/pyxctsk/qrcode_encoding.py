@@ -11,6 +11,19 @@ Intended for internal use in QR code generation and parsing for paragliding/hang
 """
 
 
+def _append_encoded_num(chars: list[str], num: int) -> None:
+    """Append the polyline encoding of ``num`` to ``chars``."""
+    # Shift left by 1 to make room for the sign bit; if negative, flip all
+    # bits so the encoded value is always non-negative (zigzag encoding)
+    pnum = ~(num << 1) if num < 0 else num << 1
+
+    while pnum > 0x1F:
+        chars.append(chr(((pnum & 0x1F) | 0x20) + 63))
+        pnum >>= 5
+
+    chars.append(chr(63 + pnum))
+
+
 def encode_num(num: int) -> str:
     """Encode a single number using the polyline algorithm.
 
@@ -20,26 +33,9 @@ def encode_num(num: int) -> str:
     Returns:
         Encoded string
     """
-    result = []
-
-    # This is to ensure the sign bit is handled correctly
-    # If num is negative, we will flip all bits later
-    # Shift left by 1 (multiply by 2)
-    pnum = num << 1
-    # If negative, flip all bits
-    if num < 0:
-        pnum = ~pnum
-
-    if pnum == 0:
-        return chr(63)
-
-    while pnum > 0x1F:
-        char_code = ((pnum & 0x1F) | 0x20) + 63
-        result.append(chr(char_code))
-        pnum = pnum >> 5
-
-    result.append(chr(63 + pnum))
-    return "".join(result)
+    chars: list[str] = []
+    _append_encoded_num(chars, num)
+    return "".join(chars)
 
 
 def encode_competition_turnpoint(lon: float, lat: float, alt: int, radius: int) -> str:
@@ -54,18 +50,15 @@ def encode_competition_turnpoint(lon: float, lat: float, alt: int, radius: int)
     Returns:
         Encoded string
     """
+    # Encode all four components into one buffer and join once, rather
+    # than building and concatenating four separate strings.
+    chars: list[str] = []
     # Round coordinates to 5 decimal places (same as Google's polyline)
-    lon_int = round(lon * 1e5)
-    lat_int = round(lat * 1e5)
-
-    # Encode each component
-    encoded_lon = encode_num(lon_int)
-    encoded_lat = encode_num(lat_int)
-    encoded_alt = encode_num(alt)
-    encoded_radius = encode_num(radius)
-
-    # Concatenate all encoded values
-    return encoded_lon + encoded_lat + encoded_alt + encoded_radius
+    _append_encoded_num(chars, round(lon * 1e5))
+    _append_encoded_num(chars, round(lat * 1e5))
+    _append_encoded_num(chars, alt)
+    _append_encoded_num(chars, radius)
+    return "".join(chars)
 
 
 def decode_nums(encoded_str: str) -> list[int]:
@@ -11,6 +11,12 @@ except ImportError:
     Image = None  # type: ignore
     QR_CODE_SUPPORT = False
 
+# Resolved once at import; Pillow>=11.3 always provides Image.Resampling.
+# QR images are 1-bit, for which Pillow resamples with NEAREST regardless.
+_ERROR_CORRECTION = qrcode.constants.ERROR_CORRECT_M if QR_CODE_SUPPORT else None
+_RESAMPLE = Image.Resampling.NEAREST if QR_CODE_SUPPORT else None
+_BORDER = 4
+
 
 def generate_qrcode_image(data: str, size: int = 1024):
     """Generates a QR code image from the provided string data.
@@ -30,20 +36,17 @@ def generate_qrcode_image(data: str, size: int = 1024):
 
     qr = qrcode.QRCode(  # type: ignore
         version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_M,  # type: ignore
-        box_size=10,
-        border=4,
+        error_correction=_ERROR_CORRECTION,
+        border=_BORDER,
     )
     qr.add_data(data)
     qr.make(fit=True)
 
-    img = qr.make_image(fill_color="black", back_color="white")
+    # Render the modules as close to the requested size as possible so the
+    # final resize is a small adjustment (or skipped) rather than an upscale
+    qr.box_size = max(1, size // (qr.modules_count + 2 * _BORDER))
+    img = qr.make_image(fill_color="black", back_color="white").get_image()
 
-    # Resize to requested size
-    try:
-        # Try new Pillow API first
-        img = img.resize((size, size), Image.Resampling.LANCZOS)  # type: ignore
-    except AttributeError:
-        # Fall back to old API for older Pillow versions
-        img = img.resize((size, size), Image.LANCZOS)  # type: ignore
+    if img.size != (size, size):
+        img = img.resize((size, size), _RESAMPLE)
     return img
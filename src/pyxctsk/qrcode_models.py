@@ -11,7 +11,6 @@ including custom polyline encoding for turnpoint coordinates. These models are u
 generating, and manipulating XCTrack-compatible QR code tasks.
 """
 
-from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -27,7 +26,7 @@ from .qrcode_enums import (
 from .shared_enums import TimeOfDay
 
 
-@dataclass
+@dataclass(slots=True)
 class QRCodeGoal:
     """QR code goal representation.
 
@@ -53,8 +52,6 @@ class QRCodeGoal:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "QRCodeGoal":
         """Create from dictionary."""
-        # TimeOfDay imported from shared_enums
-
         deadline = None
         if "d" in data:
             deadline = TimeOfDay.from_json_string(data["d"])
@@ -66,7 +63,7 @@ class QRCodeGoal:
         return cls(deadline=deadline, type=goal_type)
 
 
-@dataclass
+@dataclass(slots=True)
 class QRCodeSSS:
     """QR code SSS (Start Speed Section) representation.
 
@@ -82,12 +79,11 @@ class QRCodeSSS:
     type: QRCodeSSSType
     time_gates: list["TimeOfDay"] = field(default_factory=list)
 
-    def to_dict(self) -> OrderedDict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        # Create an ordered dict to ensure field order
-        result: OrderedDict[str, Any] = OrderedDict()
+        # Plain dicts keep insertion order, which fixes the field order.
         # Add direction first - OBSOLETE but kept for backwards compatibility
-        result["d"] = self.direction.value
+        result: dict[str, Any] = {"d": self.direction.value}
         # Add time_gates in the middle if they exist
         if self.time_gates:
             result["g"] = [gate.to_json_string() for gate in self.time_gates]
@@ -98,8 +94,6 @@ class QRCodeSSS:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "QRCodeSSS":
         """Create from dictionary."""
-        # TimeOfDay imported from shared_enums
-
         time_gates = []
         if "g" in data:
             time_gates = [TimeOfDay.from_json_string(gate) for gate in data["g"]]
@@ -118,7 +112,7 @@ class QRCodeSSS:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QRCodeTakeoff:
     """QR code takeoff representation.
 
@@ -144,8 +138,6 @@ class QRCodeTakeoff:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "QRCodeTakeoff":
         """Create from dictionary."""
-        # TimeOfDay imported from shared_enums
-
         time_open = None
         time_close = None
 
@@ -157,7 +149,7 @@ class QRCodeTakeoff:
         return cls(time_open=time_open, time_close=time_close)
 
 
-@dataclass
+@dataclass(slots=True)
 class QRCodeTurnpoint:
     """QR code turnpoint representation.
 
@@ -184,7 +176,7 @@ class QRCodeTurnpoint:
     type: QRCodeTurnpointType = QRCodeTurnpointType.NONE
     description: str | None = None
 
-    def to_dict(self, simplified: bool = False) -> OrderedDict[str, Any]:
+    def to_dict(self, simplified: bool = False) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization.
 
         Uses custom polyline encoding for turnpoint coordinates (lon, lat, alt, radius)
@@ -198,6 +190,11 @@ class QRCodeTurnpoint:
             Dictionary with fields: d (description), n (name), t (type), z (encoded coords)
             For simplified format: only n (name) and z (encoded coords)
         """
+        # Bind fields to locals once; this runs for every turnpoint of a task
+        name = self.name
+        description = self.description
+        tp_type = self.type
+
         # Use the XCTrack custom encoding
         encoded = encode_competition_turnpoint(
             self.lon, self.lat, self.alt_smoothed, self.radius
@@ -205,21 +202,18 @@ class QRCodeTurnpoint:
 
         if simplified:
             # XC/Waypoints simplified format - only name and encoded coordinates
-            return OrderedDict([("n", self.name), ("z", encoded)])
-
-        # Full format - Create result dictionary with exact order to match expected output
-        result: OrderedDict[str, Any] = OrderedDict()
+            return {"n": name, "z": encoded}
 
+        # Full format - plain dicts keep insertion order, so each key is added
+        # in the exact order of the expected output: d, n, t, z.
         # Only include description if it has a non-empty value
-        if self.description:
-            result["d"] = self.description
-
-        result["n"] = self.name
+        result: dict[str, Any] = {"d": description} if description else {}
+        result["n"] = name
 
         # Add type field before z - only for SSS (2) and ESS (3)
         # TAKEOFF (1) should not have the "t" field in QR code format
-        if self.type == QRCodeTurnpointType.SSS or self.type == QRCodeTurnpointType.ESS:
-            result["t"] = self.type.value
+        if tp_type in (QRCodeTurnpointType.SSS, QRCodeTurnpointType.ESS):
+            result["t"] = tp_type.value
 
         # Add z last
         result["z"] = encoded
@@ -245,29 +239,27 @@ class QRCodeTurnpoint:
         alt_smoothed = data.get("a", 0)
         radius = data.get("r", 1000)
 
-        # Fallback: try polyline decoding if individual fields not available
+        # Fallback: decode "z" only when individual fields are not available
         if "z" in data and ("x" not in data or "y" not in data):
+            encoded = data["z"]
             try:
                 # Try using our custom decoder for XCTrack format first
-                nums = decode_nums(data["z"])
+                nums = decode_nums(encoded)
+            except TypeError:
+                nums = []
+            if len(nums) >= 2:
+                lon = nums[0] / 1e5
+                lat = nums[1] / 1e5
                 if len(nums) >= 4:
-                    lon = nums[0] / 1e5
-                    lat = nums[1] / 1e5
                     alt_smoothed = nums[2]
                     radius = nums[3]
-                elif len(nums) >= 2:
-                    lon = nums[0] / 1e5
-                    lat = nums[1] / 1e5
-            except Exception:
+            else:
                 # Fallback to standard polyline library
                 try:
-                    coords = polyline.decode(data["z"], precision=5)
+                    coords = polyline.decode(encoded, precision=5)
                     if coords:
-                        coord = coords[0]  # Take first coordinate
-                        lon, lat = (
-                            coord[1],
-                            coord[0],
-                        )  # Note: polyline lib uses lat,lon order
+                        # Take first coordinate; polyline lib uses lat,lon order
+                        lat, lon = coords[0]
                 except Exception:
                     # If all else fails, use defaults
                     pass
@@ -26,11 +26,9 @@ This module provides:
 """
 
 import json
-from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
-
-import polyline
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
 from .qrcode_enums import (
     QRCodeDirection,
@@ -41,16 +39,123 @@ from .qrcode_enums import (
     QRCodeTurnpointType,
 )
 from .qrcode_models import QRCodeGoal, QRCodeSSS, QRCodeTakeoff, QRCodeTurnpoint
+from .shared_enums import TimeOfDay
 
 if TYPE_CHECKING:
-    from .task import Task
+    from .task import (
+        Direction,
+        EarthModel,
+        GoalType,
+        SSSType,
+        Task,
+        TaskType,
+        TurnpointType,
+    )
 
 # Constants
 QR_CODE_SCHEME = "XCTSK:"
 QR_CODE_TASK_VERSION = 2
 
+# Shared compact encoder: json.dumps() builds a new JSONEncoder on every call
+# whenever non-default options are passed.
+_COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class _TaskToQREnumMaps(NamedTuple):
+    """Task enum -> QR code enum lookup tables, one per converted field.
+
+    Keys accept ``None`` so optional fields look up to ``None`` (or a default).
+    """
+
+    task_type: "dict[TaskType | None, QRCodeTaskType]"
+    earth_model: "dict[EarthModel | None, QRCodeEarthModel]"
+    turnpoint_type: "dict[TurnpointType | None, QRCodeTurnpointType]"
+    direction: "dict[Direction | None, QRCodeDirection]"
+    sss_type: "dict[SSSType | None, QRCodeSSSType]"
+    goal_type: "dict[GoalType | None, QRCodeGoalType]"
+
+
+class _QRToTaskEnumMaps(NamedTuple):
+    """QR code enum -> Task enum lookup tables, one per converted field.
 
-@dataclass
+    Keys accept ``None`` so optional fields look up to ``None`` (or a default).
+    """
+
+    task_type: "dict[QRCodeTaskType | None, TaskType]"
+    earth_model: "dict[QRCodeEarthModel | None, EarthModel]"
+    turnpoint_type: "dict[QRCodeTurnpointType | None, TurnpointType]"
+    direction: "dict[QRCodeDirection | None, Direction]"
+    sss_type: "dict[QRCodeSSSType | None, SSSType]"
+    goal_type: "dict[QRCodeGoalType | None, GoalType]"
+
+
+@lru_cache(maxsize=1)
+def _task_to_qr_enum_maps() -> _TaskToQREnumMaps:
+    """Build (and cache) the Task enum -> QR code enum lookup tables.
+
+    Built lazily because ``task`` imports this module at import time.
+    """
+    from .task import (
+        Direction,
+        EarthModel,
+        GoalType,
+        SSSType,
+        TaskType,
+        TurnpointType,
+    )
+
+    return _TaskToQREnumMaps(
+        task_type={
+            TaskType.CLASSIC: QRCodeTaskType.CLASSIC,
+            TaskType.WAYPOINTS: QRCodeTaskType.WAYPOINTS,
+        },
+        earth_model={
+            EarthModel.WGS84: QRCodeEarthModel.WGS84,
+            EarthModel.FAI_SPHERE: QRCodeEarthModel.FAI_SPHERE,
+        },
+        turnpoint_type={
+            TurnpointType.TAKEOFF: QRCodeTurnpointType.TAKEOFF,
+            TurnpointType.SSS: QRCodeTurnpointType.SSS,
+            TurnpointType.ESS: QRCodeTurnpointType.ESS,
+        },
+        direction={
+            Direction.ENTER: QRCodeDirection.ENTER,
+            Direction.EXIT: QRCodeDirection.EXIT,
+        },
+        sss_type={
+            SSSType.RACE: QRCodeSSSType.RACE,
+            SSSType.ELAPSED_TIME: QRCodeSSSType.ELAPSED_TIME,
+        },
+        goal_type={
+            GoalType.LINE: QRCodeGoalType.LINE,
+            GoalType.CYLINDER: QRCodeGoalType.CYLINDER,
+        },
+    )
+
+
+@lru_cache(maxsize=1)
+def _qr_to_task_enum_maps() -> _QRToTaskEnumMaps:
+    """Build (and cache) the QR code enum -> Task enum lookup tables."""
+    forward = _task_to_qr_enum_maps()
+    return _QRToTaskEnumMaps(
+        task_type=_invert(forward.task_type),
+        earth_model=_invert(forward.earth_model),
+        turnpoint_type=_invert(forward.turnpoint_type),
+        direction=_invert(forward.direction),
+        sss_type=_invert(forward.sss_type),
+        goal_type=_invert(forward.goal_type),
+    )
+
+
+def _invert(mapping: "dict[_K | None, _V]") -> "dict[_V | None, _K]":
+    """Swap keys and values of a one-to-one enum lookup table."""
+    return {value: key for key, value in mapping.items() if key is not None}
+
+
+@dataclass(slots=True)
 class QRCodeTask:
     """QR code task representation.
 
@@ -98,9 +203,10 @@ class QRCodeTask:
         """
         if simplified:
             # XC/Waypoints simplified format
-            simplified_result: OrderedDict[str, Any] = OrderedDict()
-            simplified_result["T"] = "W"  # taskType: Waypoints
-            simplified_result["V"] = self.version  # version: 2
+            simplified_result: dict[str, Any] = {
+                "T": "W",  # taskType: Waypoints
+                "V": self.version,  # version: 2
+            }
 
             # Turnpoints - only include if they exist
             if self.turnpoints:
@@ -136,13 +242,11 @@ class QRCodeTask:
 
         # 5. Takeoff fields - always include them as null if not set
         # This is important to match the expected test output exactly
-        if self.takeoff:
-            takeoff_dict = self.takeoff.to_dict()
-            result["tc"] = takeoff_dict.get("c", None)
-            result["to"] = takeoff_dict.get("o", None)
-        else:
-            result["tc"] = None
-            result["to"] = None
+        takeoff = self.takeoff
+        time_close = takeoff.time_close if takeoff else None
+        time_open = takeoff.time_open if takeoff else None
+        result["tc"] = time_close.to_json_string() if time_close else None
+        result["to"] = time_open.to_json_string() if time_open else None
 
         # 6. Earth model - only include if not default (WGS84 = 0)
         if self.earth_model is not None and self.earth_model != QRCodeEarthModel.WGS84:
@@ -209,16 +313,22 @@ class QRCodeTask:
         if "t" in data and isinstance(data["t"], list):
             turnpoints = [QRCodeTurnpoint.from_dict(tp) for tp in data["t"]]
 
+        time_open_raw = data.get("to")
+        time_close_raw = data.get("tc")
         takeoff = None
-        if ("to" in data and data["to"] is not None) or (
-            "tc" in data and data["tc"] is not None
-        ):
-            takeoff_data = {}
-            if "to" in data:
-                takeoff_data["o"] = data["to"]
-            if "tc" in data:
-                takeoff_data["c"] = data["tc"]
-            takeoff = QRCodeTakeoff.from_dict(takeoff_data)
+        if time_open_raw is not None or time_close_raw is not None:
+            takeoff = QRCodeTakeoff(
+                time_open=(
+                    TimeOfDay.from_json_string(time_open_raw)
+                    if time_open_raw is not None
+                    else None
+                ),
+                time_close=(
+                    TimeOfDay.from_json_string(time_close_raw)
+                    if time_close_raw is not None
+                    else None
+                ),
+            )
 
         sss = None
         if "s" in data and isinstance(data["s"], dict):
@@ -245,11 +355,7 @@ class QRCodeTask:
         Returns:
             Compact JSON string suitable for QR code embedding
         """
-        return json.dumps(
-            self.to_dict(simplified=simplified),
-            separators=(",", ":"),
-            ensure_ascii=False,
-        )
+        return _COMPACT_JSON_ENCODER.encode(self.to_dict(simplified=simplified))
 
     def to_waypoints_json(self) -> str:
         """Convert to XC/Waypoints simplified JSON format.
@@ -313,41 +419,15 @@ class QRCodeTask:
         Returns:
             QRCodeTask instance optimized for QR code embedding
         """
-        from .task import (
-            Direction,
-            EarthModel,
-            GoalType,
-            SSSType,
-            TaskType,
-            TurnpointType,
-        )
-
-        # Convert task type
-        qr_task_type = None
-        if task.task_type == TaskType.CLASSIC:
-            qr_task_type = QRCodeTaskType.CLASSIC
-        elif task.task_type == TaskType.WAYPOINTS:
-            qr_task_type = QRCodeTaskType.WAYPOINTS
-
-        # Convert earth model
-        qr_earth_model = None
-        if task.earth_model == EarthModel.WGS84:
-            qr_earth_model = QRCodeEarthModel.WGS84
-        elif task.earth_model == EarthModel.FAI_SPHERE:
-            qr_earth_model = QRCodeEarthModel.FAI_SPHERE
+        maps = _task_to_qr_enum_maps()
+        qr_task_type = maps.task_type.get(task.task_type)
+        qr_earth_model = maps.earth_model.get(task.earth_model)
 
         # Convert turnpoints
+        turnpoint_types = maps.turnpoint_type
         qr_turnpoints = []
-        coordinates = []
-
         for tp in task.turnpoints:
-            qr_type = QRCodeTurnpointType.NONE
-            if tp.type == TurnpointType.TAKEOFF:
-                qr_type = QRCodeTurnpointType.TAKEOFF
-            elif tp.type == TurnpointType.SSS:
-                qr_type = QRCodeTurnpointType.SSS
-            elif tp.type == TurnpointType.ESS:
-                qr_type = QRCodeTurnpointType.ESS
+            qr_type = turnpoint_types.get(tp.type, QRCodeTurnpointType.NONE)
 
             qr_turnpoint = QRCodeTurnpoint(
                 lat=tp.waypoint.lat,
@@ -359,10 +439,6 @@ class QRCodeTask:
                 description=tp.waypoint.description,
             )
             qr_turnpoints.append(qr_turnpoint)
-            coordinates.append((tp.waypoint.lat, tp.waypoint.lon))
-
-        # Generate polyline from coordinates
-        turnpoints_polyline = polyline.encode(coordinates, precision=5)
 
         # Convert takeoff
         qr_takeoff = None
@@ -375,16 +451,8 @@ class QRCodeTask:
         # Convert SSS
         qr_sss = None
         if task.sss:
-            qr_direction = (
-                QRCodeDirection.ENTER
-                if task.sss.direction == Direction.ENTER
-                else QRCodeDirection.EXIT
-            )
-            qr_sss_type = (
-                QRCodeSSSType.RACE
-                if task.sss.type == SSSType.RACE
-                else QRCodeSSSType.ELAPSED_TIME
-            )
+            qr_direction = maps.direction.get(task.sss.direction, QRCodeDirection.EXIT)
+            qr_sss_type = maps.sss_type.get(task.sss.type, QRCodeSSSType.ELAPSED_TIME)
 
             qr_sss = QRCodeSSS(
                 direction=qr_direction,
@@ -395,11 +463,7 @@ class QRCodeTask:
         # Convert goal
         qr_goal = None
         if task.goal:
-            qr_goal_type = None
-            if task.goal.type == GoalType.LINE:
-                qr_goal_type = QRCodeGoalType.LINE
-            elif task.goal.type == GoalType.CYLINDER:
-                qr_goal_type = QRCodeGoalType.CYLINDER
+            qr_goal_type = maps.goal_type.get(task.goal.type)
 
             qr_goal = QRCodeGoal(
                 deadline=task.goal.deadline,
@@ -410,7 +474,9 @@ class QRCodeTask:
             version=QR_CODE_TASK_VERSION,
             task_type=qr_task_type,
             earth_model=qr_earth_model,
-            turnpoints_polyline=turnpoints_polyline,
+            # Coordinates are serialized per turnpoint ("z"), never as a
+            # task-level polyline, so don't spend a pass encoding one here.
+            turnpoints_polyline=None,
             turnpoints=qr_turnpoints,
             takeoff=qr_takeoff,
             sss=qr_sss,
@@ -467,40 +533,24 @@ class QRCodeTask:
         from .task import (
             SSS,
             Direction,
-            EarthModel,
             Goal,
-            GoalType,
             SSSType,
             Takeoff,
             Task,
             TaskType,
             Turnpoint,
-            TurnpointType,
             Waypoint,
         )
 
-        # Convert task type
-        task_type = TaskType.CLASSIC
-        if self.task_type == QRCodeTaskType.WAYPOINTS:
-            task_type = TaskType.WAYPOINTS
-
-        # Convert earth model
-        earth_model = None
-        if self.earth_model == QRCodeEarthModel.WGS84:
-            earth_model = EarthModel.WGS84
-        elif self.earth_model == QRCodeEarthModel.FAI_SPHERE:
-            earth_model = EarthModel.FAI_SPHERE
+        maps = _qr_to_task_enum_maps()
+        task_type = maps.task_type.get(self.task_type, TaskType.CLASSIC)
+        earth_model = maps.earth_model.get(self.earth_model)
 
         # Convert turnpoints
+        turnpoint_types = maps.turnpoint_type
         turnpoints = []
         for qr_tp in self.turnpoints:
-            tp_type = None
-            if qr_tp.type == QRCodeTurnpointType.TAKEOFF:
-                tp_type = TurnpointType.TAKEOFF
-            elif qr_tp.type == QRCodeTurnpointType.SSS:
-                tp_type = TurnpointType.SSS
-            elif qr_tp.type == QRCodeTurnpointType.ESS:
-                tp_type = TurnpointType.ESS
+            tp_type = turnpoint_types.get(qr_tp.type)
 
             waypoint = Waypoint(
                 name=qr_tp.name,
@@ -528,16 +578,8 @@ class QRCodeTask:
         # Convert SSS
         sss = None
         if self.sss:
-            direction = (
-                Direction.ENTER
-                if self.sss.direction == QRCodeDirection.ENTER
-                else Direction.EXIT
-            )
-            sss_type = (
-                SSSType.RACE
-                if self.sss.type == QRCodeSSSType.RACE
-                else SSSType.ELAPSED_TIME
-            )
+            direction = maps.direction.get(self.sss.direction, Direction.EXIT)
+            sss_type = maps.sss_type.get(self.sss.type, SSSType.ELAPSED_TIME)
 
             sss = SSS(
                 type=sss_type,
@@ -549,11 +591,7 @@ class QRCodeTask:
         # Convert goal
         goal = None
         if self.goal:
-            goal_type = None
-            if self.goal.type == QRCodeGoalType.LINE:
-                goal_type = GoalType.LINE
-            elif self.goal.type == QRCodeGoalType.CYLINDER:
-                goal_type = GoalType.CYLINDER
+            goal_type = maps.goal_type.get(self.goal.type)
 
             goal = Goal(
                 type=goal_type,
@@ -143,19 +143,22 @@ def _optimize_plane_points(
     if n < 2:
         return points
 
+    # The final point has no successor and is handled separately; unpack the
+    # interior circles once instead of on every sweep.
+    last = n - 1
+    interior = [((cx, cy), radius) for cx, cy, radius in circles[1:last]]
+
     previous_length = _polyline_length(points)
     for sweep in range(max_sweeps):
         for parity in (1, 0):
-            for i in range(1, n):
-                if i % 2 != parity:
-                    continue
-                cx, cy, radius = circles[i]
-                if i == n - 1:
-                    points[i] = _closest_circle_point(points[i - 1], circles[i])
-                else:
-                    points[i] = plane_optimal_point(
-                        points[i - 1], points[i + 1], (cx, cy), radius
-                    )
+            # Odd indices start at 1, even ones at 2 (index 0 stays fixed)
+            for i in range(2 - parity, last, 2):
+                center, radius = interior[i - 1]
+                points[i] = plane_optimal_point(
+                    points[i - 1], points[i + 1], center, radius
+                )
+            if last % 2 == parity:
+                points[last] = _closest_circle_point(points[last - 1], circles[last])
         current_length = _polyline_length(points)
         if show_progress:
             print(f"    🔄 Sweep {sweep + 1}: {current_length / 1000.0:.4f}km")
@@ -202,33 +205,36 @@ def calculate_iteratively_refined_route(
     if show_progress and turnpoints[-1].goal_type == "LINE":
         print("    🏁 Task has a goal line finish")
 
-    circles, to_geo = _plane_circles(turnpoints, earth_model)
-    plane_points = _optimize_plane_points(
-        circles,
-        max_sweeps=max_sweeps,
-        show_progress=show_progress,
-    )
-
-    g = geod_for_earth_model(earth_model)
-    route: list[tuple[float, float]] = []
-    for i, ((x, y), (_, _, radius), tp) in enumerate(
-        zip(plane_points, circles, turnpoints)
-    ):
-        if i == 0 or radius <= 0.0:
-            # Takeoff start point and zero-radius circles (including LINE
-            # goals) sit exactly on the turnpoint center.
-            route.append((tp.center[0], tp.center[1]))
-            continue
-        # ProjectionCorrection (§7.1.7): re-place the planar solution at
-        # exactly radius r on the earth model along the center→point azimuth.
-        route.append(
-            snap_to_boundary(to_geo.transform(x, y), tp.center, radius, earth_model)
+    if all(tp.goal_type == "LINE" or tp.radius <= 0 for tp in turnpoints[1:]):
+        # Only centers and goal lines: every route point is a turnpoint
+        # center, so skip the projection and the sweeps entirely.
+        route = [(tp.center[0], tp.center[1]) for tp in turnpoints]
+    else:
+        circles, to_geo = _plane_circles(turnpoints, earth_model)
+        plane_points = _optimize_plane_points(
+            circles,
+            max_sweeps=max_sweeps,
+            show_progress=show_progress,
         )
 
-    distance = 0.0
-    for i in range(len(route) - 1):
-        _, _, leg = g.inv(route[i][1], route[i][0], route[i + 1][1], route[i + 1][0])
-        distance += float(leg)
+        route = []
+        for i, ((x, y), (_, _, radius), tp) in enumerate(
+            zip(plane_points, circles, turnpoints)
+        ):
+            if i == 0 or radius <= 0.0:
+                # Takeoff start point and zero-radius circles (including LINE
+                # goals) sit exactly on the turnpoint center.
+                route.append((tp.center[0], tp.center[1]))
+                continue
+            # ProjectionCorrection (§7.1.7): re-place the planar solution at
+            # exactly radius r on the earth model along the center→point azimuth.
+            route.append(
+                snap_to_boundary(to_geo.transform(x, y), tp.center, radius, earth_model)
+            )
+
+    g = geod_for_earth_model(earth_model)
+    # Sum all legs in one vectorized geodesic call rather than one per leg
+    distance = float(g.line_length([p[1] for p in route], [p[0] for p in route]))
 
     if show_progress:
         print(f"    ✅ Optimized route: {distance / 1000.0:.3f}km")
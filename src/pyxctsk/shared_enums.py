@@ -1,12 +1,12 @@
 """Common enums shared across pyxctsk modules to avoid circular imports."""
 
-import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .exceptions import InvalidTimeOfDayError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeOfDay:
     """Represents a time of day (HH:MM:SS).
 
@@ -40,7 +40,7 @@ class TimeOfDay:
         Returns:
             str: The time as ``HH:MM:SSZ``.
         """
-        return f"{self.hour:02d}:{self.minute:02d}:{self.second:02d}Z"
+        return _render_time_of_day(self.hour, self.minute, self.second)
 
     @classmethod
     def from_json_string(cls, time_str: str) -> "TimeOfDay":
@@ -56,20 +56,53 @@ class TimeOfDay:
             InvalidTimeOfDayError: If the string is not a valid time.
         """
         # Handle both quoted and unquoted formats
-        if time_str.startswith('"') and time_str.endswith('"'):
+        if time_str[:1] == '"' == time_str[-1:]:
             time_str = time_str[1:-1]  # Remove quotes
 
-        pattern = r"^(\d{2}):(\d{2}):(\d{2})Z$"
-        match = re.match(pattern, time_str)
-        if not match:
-            raise InvalidTimeOfDayError(f"Invalid time string: {time_str}")
-
-        hour = int(match.group(1))
-        minute = int(match.group(2))
-        second = int(match.group(3))
-
-        return cls(hour=hour, minute=minute, second=second)
+        parsed = _parse_time_of_day(time_str)
+        if cls is TimeOfDay:
+            return parsed
+        # Subclasses reuse the cached, already validated fields
+        return cls(hour=parsed.hour, minute=parsed.minute, second=parsed.second)
 
     def __str__(self) -> str:
         """Return string representation in HH:MM:SSZ format."""
-        return f"{self.hour:02d}:{self.minute:02d}:{self.second:02d}Z"
+        return self.to_json_string()
+
+
+@lru_cache(maxsize=4096)
+def _render_time_of_day(hour: int, minute: int, second: int) -> str:
+    """Render a time as ``HH:MM:SSZ``, cached per distinct time.
+
+    Kept outside the dataclass so the cache is not part of its fields.
+    """
+    return f"{hour:02d}:{minute:02d}:{second:02d}Z"
+
+
+@lru_cache(maxsize=4096)
+def _parse_time_of_day(time_str: str) -> TimeOfDay:
+    """Parse an unquoted ``HH:MM:SSZ`` string into a shared TimeOfDay.
+
+    Tasks repeat the same times (start gates, deadlines, close times), and
+    TimeOfDay is frozen, so identical strings map to one cached instance.
+    Invalid strings raise and are therefore never cached.
+    """
+    # Fixed-width "HH:MM:SSZ": check the layout and slice out the fields
+    # directly instead of running a regex
+    hour_str, minute_str, second_str = time_str[0:2], time_str[3:5], time_str[6:8]
+    if not (
+        len(time_str) == 9
+        and time_str[2] == ":"
+        and time_str[5] == ":"
+        and time_str[8] == "Z"
+        and hour_str.isdecimal()
+        and minute_str.isdecimal()
+        and second_str.isdecimal()
+    ):
+        raise InvalidTimeOfDayError(f"Invalid time string: {time_str}")
+
+    hour = int(hour_str)
+    minute = int(minute_str)
+    second = int(second_str)
+
+    return TimeOfDay(hour=hour, minute=minute, second=second)
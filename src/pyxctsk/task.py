@@ -14,11 +14,17 @@ support for QR code encoding/decoding and distance calculations (see related mod
 import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
 
 from .qrcode_task import QRCodeTask
 from .shared_enums import TimeOfDay
 
+# Optional fast JSON parser for from_json; the stdlib json module is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 class Direction(str, Enum):
     """Enumeration of direction types for turnpoints.
@@ -96,7 +102,30 @@ class TurnpointType(str, Enum):
     ESS = "ESS"
 
 
-@dataclass
+_E = TypeVar("_E", bound=Enum)
+
+# Value -> member tables used by the from_dict parsers
+_DIRECTION_BY_VALUE = {m.value: m for m in Direction}
+_EARTH_MODEL_BY_VALUE = {m.value: m for m in EarthModel}
+_GOAL_TYPE_BY_VALUE = {m.value: m for m in GoalType}
+_SSS_TYPE_BY_VALUE = {m.value: m for m in SSSType}
+_TASK_TYPE_BY_VALUE = {m.value: m for m in TaskType}
+_TURNPOINT_TYPE_BY_VALUE = {m.value: m for m in TurnpointType}
+
+
+def _enum_member(table: dict[str, _E], enum_cls: type[_E], value: str) -> _E:
+    """Look up an enum member by value via a prebuilt table.
+
+    Unknown values fall through to the enum constructor so callers still
+    get the usual ``ValueError``.
+    """
+    try:
+        return table[value]
+    except KeyError:
+        return enum_cls(value)
+
+
+@dataclass(slots=True)
 class Waypoint:
     """Represents a waypoint with coordinates and optional description.
 
@@ -120,15 +149,22 @@ class Waypoint:
         Returns:
             Dict[str, Any]: Dictionary representation for JSON.
         """
-        result = {
+        # One dict literal per shape instead of inserting the optional key
+        description = self.description
+        if description:
+            return {
+                "name": self.name,
+                "lat": self.lat,
+                "lon": self.lon,
+                "altSmoothed": self.alt_smoothed,
+                "description": description,
+            }
+        return {
             "name": self.name,
             "lat": self.lat,
             "lon": self.lon,
             "altSmoothed": self.alt_smoothed,
         }
-        if self.description:
-            result["description"] = self.description
-        return result
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Waypoint":
@@ -149,7 +185,7 @@ class Waypoint:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Turnpoint:
     """Represents a turnpoint in a task.
 
@@ -169,13 +205,17 @@ class Turnpoint:
         Returns:
             Dict[str, Any]: Dictionary representation for JSON.
         """
-        result = {
+        tp_type = self.type
+        if tp_type and tp_type != TurnpointType.NONE:
+            return {
+                "radius": self.radius,
+                "waypoint": self.waypoint.to_dict(),
+                "type": tp_type.value,
+            }
+        return {
             "radius": self.radius,
             "waypoint": self.waypoint.to_dict(),
         }
-        if self.type and self.type != TurnpointType.NONE:
-            result["type"] = self.type.value
-        return result
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Turnpoint":
@@ -188,8 +228,11 @@ class Turnpoint:
             Turnpoint: Parsed Turnpoint object.
         """
         turnpoint_type = None
-        if "type" in data and data["type"]:
-            turnpoint_type = TurnpointType(data["type"])
+        tp_type = data.get("type")
+        if tp_type:
+            turnpoint_type = _enum_member(
+                _TURNPOINT_TYPE_BY_VALUE, TurnpointType, tp_type
+            )
 
         return cls(
             radius=data["radius"],
@@ -198,7 +241,7 @@ class Turnpoint:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Takeoff:
     """Represents takeoff window with open/close times.
 
@@ -233,18 +276,18 @@ class Takeoff:
         Returns:
             Takeoff: Parsed Takeoff object.
         """
-        time_open = None
-        time_close = None
-
-        if "timeOpen" in data:
-            time_open = TimeOfDay.from_json_string(data["timeOpen"])
-        if "timeClose" in data:
-            time_close = TimeOfDay.from_json_string(data["timeClose"])
+        # One dict probe per optional key: .get() and a None check
+        time_open = data.get("timeOpen")
+        if time_open is not None:
+            time_open = TimeOfDay.from_json_string(time_open)
+        time_close = data.get("timeClose")
+        if time_close is not None:
+            time_close = TimeOfDay.from_json_string(time_close)
 
         return cls(time_open=time_open, time_close=time_close)
 
 
-@dataclass
+@dataclass(slots=True)
 class SSS:
     """Represents a start of speed section (SSS).
 
@@ -285,25 +328,26 @@ class SSS:
         Returns:
             SSS: Parsed SSS object.
         """
-        time_gates = []
-        if "timeGates" in data:
-            time_gates = [
-                TimeOfDay.from_json_string(gate) for gate in data["timeGates"]
-            ]
+        gates = data.get("timeGates")
+        time_gates = (
+            [TimeOfDay.from_json_string(gate) for gate in gates]
+            if gates is not None
+            else []
+        )
 
-        time_close = None
-        if "timeClose" in data:
-            time_close = TimeOfDay.from_json_string(data["timeClose"])
+        time_close = data.get("timeClose")
+        if time_close is not None:
+            time_close = TimeOfDay.from_json_string(time_close)
 
         return cls(
-            type=SSSType(data["type"]),
-            direction=Direction(data["direction"]),
+            type=_enum_member(_SSS_TYPE_BY_VALUE, SSSType, data["type"]),
+            direction=_enum_member(_DIRECTION_BY_VALUE, Direction, data["direction"]),
             time_gates=time_gates,
             time_close=time_close,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Goal:
     """Represents a goal for a task.
 
@@ -347,21 +391,20 @@ class Goal:
         Returns:
             Goal: Parsed Goal object.
         """
-        goal_type = None
-        deadline = None
-        line_length = None  # No default line length
-
-        if "type" in data:
-            goal_type = GoalType(data["type"])
-        if "deadline" in data:
-            deadline = TimeOfDay.from_json_string(data["deadline"])
-        if "lineLength" in data and data["lineLength"] is not None:
-            line_length = float(data["lineLength"])
+        goal_type = data.get("type")
+        if goal_type is not None:
+            goal_type = _enum_member(_GOAL_TYPE_BY_VALUE, GoalType, goal_type)
+        deadline = data.get("deadline")
+        if deadline is not None:
+            deadline = TimeOfDay.from_json_string(deadline)
+        line_length = data.get("lineLength")  # No default line length
+        if line_length is not None:
+            line_length = float(line_length)
 
         return cls(type=goal_type, deadline=deadline, line_length=line_length)
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents an XCTrack task, including turnpoints and settings.
 
@@ -464,26 +507,26 @@ class Task:
         """
         turnpoints = [Turnpoint.from_dict(tp) for tp in data["turnpoints"]]
 
-        earth_model = None
-        if "earthModel" in data:
-            earth_model = EarthModel(data["earthModel"])
+        earth_model = data.get("earthModel")
+        if earth_model is not None:
+            earth_model = _enum_member(_EARTH_MODEL_BY_VALUE, EarthModel, earth_model)
 
-        takeoff = None
-        if "takeoff" in data:
-            takeoff = Takeoff.from_dict(data["takeoff"])
+        takeoff = data.get("takeoff")
+        if takeoff is not None:
+            takeoff = Takeoff.from_dict(takeoff)
 
-        sss = None
-        if "sss" in data:
-            sss = SSS.from_dict(data["sss"])
+        sss = data.get("sss")
+        if sss is not None:
+            sss = SSS.from_dict(sss)
 
-        goal = None
-        if "goal" in data:
-            goal = Goal.from_dict(data["goal"])
+        goal = data.get("goal")
+        if goal is not None:
+            goal = Goal.from_dict(goal)
 
         # Goal defaults are derived once in Task.__post_init__; no need to
         # repeat the rules here.
         return cls(
-            task_type=TaskType(data["taskType"]),
+            task_type=_enum_member(_TASK_TYPE_BY_VALUE, TaskType, data["taskType"]),
             version=data["version"],
             turnpoints=turnpoints,
             earth_model=earth_model,
@@ -498,6 +541,8 @@ class Task:
         Returns:
             str: JSON string representation of the task.
         """
+        # Always the stdlib: orjson writes non-ASCII text unescaped and short
+        # floats differently (1e-5 vs 1e-05), which would change the output
         return json.dumps(self.to_dict(), separators=(",", ":"))
 
     @classmethod
@@ -510,7 +555,7 @@ class Task:
         Returns:
             Task: Parsed Task object.
         """
-        data = json.loads(json_str)
+        data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
         return cls.from_dict(data)
 
     def to_qr_code_task(self) -> QRCodeTask:
@@ -545,4 +590,6 @@ class Task:
         if not ess_tp:
             return False
 
-        return ess_tp == self.turnpoints[-1]
+        # ess_tp comes from self.turnpoints, so identity suffices; dataclass
+        # equality would compare every field of both turnpoints.
+        return ess_tp is self.turnpoints[-1]
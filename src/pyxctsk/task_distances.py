@@ -111,6 +111,8 @@ def _create_turnpoint_details(
     task_turnpoints,
     task_distance_turnpoints: list[TaskTurnpoint],
     show_progress: bool = False,
+    num_iterations: int | None = None,
+    optimized_distance_m: float | None = None,
 ) -> list[dict[str, Any]]:
     """Create detailed turnpoint information including cumulative distances.
 
@@ -118,12 +120,17 @@ def _create_turnpoint_details(
         task_turnpoints: Original task turnpoints.
         task_distance_turnpoints (List[TaskTurnpoint]): Distance calculation turnpoints.
         show_progress (bool): Whether to show progress.
+        num_iterations (Optional[int]): Maximum number of alternating sweeps.
+        optimized_distance_m (Optional[float]): Optimized distance of the whole
+            task if already known; reused for the last turnpoint instead of
+            optimizing the full route a second time.
 
     Returns:
         List[Dict[str, Any]]: List of dictionaries with turnpoint details.
     """
     turnpoint_details = []
     cumulative_center = 0.0
+    last_index = len(task_distance_turnpoints) - 1
 
     for i, (tp, task_tp) in enumerate(zip(task_turnpoints, task_distance_turnpoints)):
         cumulative_opt = 0.0
@@ -142,10 +149,16 @@ def _create_turnpoint_details(
             cumulative_center += leg_distance
 
             # For optimized distance, calculate using all turnpoints up to current
-            partial_turnpoints = task_distance_turnpoints[: i + 1]
-            if len(partial_turnpoints) >= 2:
+            if i == last_index and optimized_distance_m is not None:
+                cumulative_opt = optimized_distance_m / 1000.0
+            else:
                 cumulative_opt = (
-                    optimized_distance(partial_turnpoints, show_progress=False) / 1000.0
+                    optimized_distance(
+                        task_distance_turnpoints[: i + 1],
+                        show_progress=False,
+                        num_iterations=num_iterations,
+                    )
+                    / 1000.0
                 )
 
         turnpoint_details.append(
@@ -231,6 +244,8 @@ def calculate_task_distances(
         task.turnpoints,
         turnpoints,
         show_progress,
+        num_iterations=num_iterations,
+        optimized_distance_m=opt_dist,
     )
 
     if show_progress:
@@ -22,7 +22,6 @@ from functools import lru_cache
 from typing import Protocol, runtime_checkable
 
 from pyproj import CRS, Geod, Transformer
-from scipy.optimize import fminbound
 
 #: Radius of the FAI sphere earth model in meters (FAI Sporting Code S7F).
 FAI_SPHERE_RADIUS_M = 6_371_000.0
@@ -35,6 +34,24 @@ _FAI_SPHERE_GEOD = Geod(a=FAI_SPHERE_RADIUS_M, b=FAI_SPHERE_RADIUS_M)
 # Retained module-level name for backwards compatibility (WGS84 ellipsoid).
 geod = _WGS84_GEOD
 
+# Reflection-case solver (_plane_pcp_point): (angle, cos, sin) samples of the
+# coarse ring scan, the number of extra samples spread over the arc between the
+# two neighbours, the smallest angular gap kept between samples, and the
+# angular tolerance / step cap of the Newton refinement.
+# Refinement steps that Newton cannot take fall back to golden-section steps
+# (fraction 2 - phi of the larger side of the bracket).
+_TWO_PI = 2.0 * math.pi
+_PCP_SCAN = 16
+_PCP_SCAN_SAMPLES = tuple(
+    (theta, math.cos(theta), math.sin(theta))
+    for theta in (_TWO_PI * k / _PCP_SCAN for k in range(_PCP_SCAN))
+)
+_PCP_ARC_SEEDS = 8
+_PCP_MIN_SAMPLE_GAP = 1e-9
+_PCP_THETA_TOL = 1e-12
+_PCP_MAX_REFINE_STEPS = 100
+_GOLDEN_SECTION = (3.0 - math.sqrt(5.0)) / 2.0
+
 
 def _is_fai_sphere(earth_model: object) -> bool:
     """Return True if the given earth model designates the FAI sphere.
@@ -164,13 +181,6 @@ def _segment_circle_intersections(
     return sorted(t for t in roots if 0.0 <= t <= 1.0)
 
 
-def _plane_point_at(
-    center: tuple[float, float], radius: float, theta: float
-) -> tuple[float, float]:
-    """Return the boundary point of a planar circle at angle ``theta``."""
-    return (center[0] + radius * math.cos(theta), center[1] + radius * math.sin(theta))
-
-
 def _plane_pcp_point(
     p1: tuple[float, float],
     p2: tuple[float, float],
@@ -179,10 +189,13 @@ def _plane_pcp_point(
 ) -> tuple[float, float]:
     """Solve the reflection (point-circle-point) case in the plane.
 
-    Finds the boundary point minimizing ``|p1 - x| + |x - p2|``. A coarse
-    global scan brackets the minimum, then a bounded scalar minimization
-    refines it — robust for every endpoint configuration (both neighbours
-    outside, or both inside, the circle).
+    Finds the boundary point minimizing ``|p1 - x| + |x - p2|``. The objective
+    can have several local minima in the angle (both neighbours inside the
+    circle, or grazing it), so a coarse ring of samples, densified along the
+    arc between the neighbours' directions, brackets every candidate minimum.
+    Each is refined by Newton steps on the analytic first and second
+    derivatives, safeguarded by golden-section steps within its bracket, and
+    the best is returned.
 
     Args:
         p1: Previous point (x, y).
@@ -193,17 +206,102 @@ def _plane_pcp_point(
     Returns:
         The optimal boundary point (x, y).
     """
-
-    def total(theta: float) -> float:
-        x, y = _plane_point_at(center, radius, theta)
-        return math.hypot(x - p1[0], y - p1[1]) + math.hypot(x - p2[0], y - p2[1])
-
-    scan = 64
-    best_k = min(range(scan), key=lambda k: total(2.0 * math.pi * k / scan))
-    lo = 2.0 * math.pi * (best_k - 1) / scan
-    hi = 2.0 * math.pi * (best_k + 1) / scan
-    theta_opt = float(fminbound(total, lo, hi, xtol=1e-12))
-    return _plane_point_at(center, radius, theta_opt)
+    cx, cy = center
+    ax, ay = p1
+    bx, by = p2
+
+    def evaluate(theta: float) -> tuple[float, float, float]:
+        # Path length f and its first two derivatives in θ. With
+        # x = c + r·u(θ), t = (-sin θ, cos θ) and g_i = (x - p_i)·t / d_i:
+        # f' = r·Σ g_i and f'' = r·Σ (r·(1 - g_i²) - (x - p_i)·u) / d_i.
+        ux, uy = math.cos(theta), math.sin(theta)
+        dx1 = cx + radius * ux - ax
+        dy1 = cy + radius * uy - ay
+        dx2 = cx + radius * ux - bx
+        dy2 = cy + radius * uy - by
+        d1 = math.hypot(dx1, dy1)
+        d2 = math.hypot(dx2, dy2)
+        if d1 == 0.0 or d2 == 0.0:
+            return d1 + d2, 0.0, 0.0
+        g1 = (ux * dy1 - uy * dx1) / d1
+        g2 = (ux * dy2 - uy * dx2) / d2
+        curvature = (radius * (1.0 - g1 * g1) - (ux * dx1 + uy * dy1)) / d1 + (
+            radius * (1.0 - g2 * g2) - (ux * dx2 + uy * dy2)
+        ) / d2
+        return d1 + d2, radius * (g1 + g2), radius * curvature
+
+    def refine(lo: float, theta: float, hi: float) -> tuple[float, float]:
+        # Shrink the bracket lo < theta < hi, keeping f(theta) no larger than
+        # at either end, so the result never exceeds the starting sample.
+        f_theta, slope, curvature = evaluate(theta)
+        for _ in range(_PCP_MAX_REFINE_STEPS):
+            if curvature > 0.0 and lo < theta - slope / curvature < hi:
+                trial = theta - slope / curvature
+            elif hi - theta > theta - lo:
+                trial = theta + _GOLDEN_SECTION * (hi - theta)
+            else:
+                trial = theta - _GOLDEN_SECTION * (theta - lo)
+            if abs(trial - theta) < _PCP_THETA_TOL:
+                break
+            f_trial, trial_slope, trial_curvature = evaluate(trial)
+            if f_trial <= f_theta:
+                if trial > theta:
+                    lo = theta
+                else:
+                    hi = theta
+                theta, f_theta = trial, f_trial
+                slope, curvature = trial_slope, trial_curvature
+            elif trial > theta:
+                hi = trial
+            else:
+                lo = trial
+        return f_theta, theta
+
+    # Global scan: a fixed ring of directions, densified along the shorter arc
+    # between the directions of the two neighbours. The minima that the ring
+    # alone can miss (a neighbour grazing the boundary, or both just inside it)
+    # lie on that arc.
+    theta1 = math.atan2(ay - cy, ax - cx)
+    arc = (math.atan2(by - cy, bx - cx) - theta1 + math.pi) % _TWO_PI - math.pi
+    # Samples closer than _PCP_MIN_SAMPLE_GAP to the previous one (a seed on a
+    # ring angle for axis-aligned or centred neighbours, coinciding seeds, or
+    # the wrap at 2π) are dropped, so every sample brackets a non-empty arc.
+    samples: list[tuple[float, float, float]] = []
+    for sample in sorted(
+        _PCP_SCAN_SAMPLES
+        + tuple(
+            (t % _TWO_PI, math.cos(t), math.sin(t))
+            for t in (
+                theta1 + arc * j / _PCP_ARC_SEEDS for j in range(_PCP_ARC_SEEDS + 1)
+            )
+        )
+    ):
+        if samples and sample[0] - samples[-1][0] < _PCP_MIN_SAMPLE_GAP:
+            continue
+        samples.append(sample)
+    if samples[-1][0] - samples[0][0] > _TWO_PI - _PCP_MIN_SAMPLE_GAP:
+        samples.pop()
+    angles = [t for t, _, _ in samples]
+    totals = [
+        math.hypot(cx + radius * ux - ax, cy + radius * uy - ay)
+        + math.hypot(cx + radius * ux - bx, cy + radius * uy - by)
+        for _, ux, uy in samples
+    ]
+
+    # Refine every discrete local minimum of the samples (usually one or two)
+    # between its neighbouring samples and keep the best.
+    n = len(samples)
+    starts = [
+        i for i in range(n) if totals[i - 1] > totals[i] <= totals[(i + 1) % n]
+    ] or [min(range(n), key=totals.__getitem__)]
+    best_total, best_theta = math.inf, 0.0
+    for i in starts:
+        lo = angles[i - 1] - (_TWO_PI if i == 0 else 0.0)
+        hi = angles[i + 1] if i + 1 < n else angles[0] + _TWO_PI
+        total, theta = refine(lo, angles[i], hi)
+        if total < best_total:
+            best_total, best_theta = total, theta
+    return (cx + radius * math.cos(best_theta), cy + radius * math.sin(best_theta))
 
 
 def plane_optimal_point(
@@ -319,6 +417,8 @@ class TurnpointGeometry(Protocol):
 class TaskTurnpoint:
     """Turnpoint class for distance calculations."""
 
+    __slots__ = ("center", "radius", "goal_type", "goal_line_length", "earth_model")
+
     def __init__(
         self,
         lat: float,
@@ -426,9 +526,9 @@ def distance_through_centers(
     if earth_model is None:
         earth_model = getattr(turnpoints[0], "earth_model", None)
 
-    total = 0.0
-    for i in range(len(turnpoints) - 1):
-        total += geodesic_distance(
-            turnpoints[i].center, turnpoints[i + 1].center, earth_model
+    g = geod_for_earth_model(earth_model)
+    return float(
+        g.line_length(
+            [tp.center[1] for tp in turnpoints], [tp.center[0] for tp in turnpoints]
         )
-    return total
+    )
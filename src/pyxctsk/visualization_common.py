@@ -5,6 +5,7 @@ including turnpoint filtering, route coordinate generation, and styling helpers.
 """
 
 import math
+from collections.abc import Iterator
 
 from .distance import optimized_route_coordinates
 from .goal_line import should_skip_last_turnpoint
@@ -15,6 +16,25 @@ from .task_distances import _task_to_turnpoints
 CIRCLE_POINTS = 64  # Number of points to approximate circle
 METERS_PER_DEGREE = 111320.0  # 1 degree ≈ 111.32 km at equator
 
+# (sin, cos) of every circle vertex angle. The angles only depend on
+# CIRCLE_POINTS, so the trig is done once here instead of per point per circle.
+_UNIT_CIRCLE = [
+    (
+        math.sin(2 * math.pi * i / CIRCLE_POINTS),
+        math.cos(2 * math.pi * i / CIRCLE_POINTS),
+    )
+    for i in range(CIRCLE_POINTS + 1)  # +1 to close the circle
+]
+
+# Turnpoint zone colors
+_GOAL_COLOR = "#ff0000"  # Red for goal
+_DEFAULT_COLOR = "#269abc"  # Default blue
+_TURNPOINT_COLORS = {
+    TurnpointType.TAKEOFF: "#204d74",  # Dark blue
+    TurnpointType.SSS: "#ac2925",  # Dark red
+    TurnpointType.ESS: "#ff8c00",  # Orange
+}
+
 
 def get_turnpoints_to_render(task: Task) -> list[Turnpoint]:
     """Get the list of turnpoints that should be rendered for visualization.
@@ -58,15 +78,22 @@ def get_turnpoint_color_hex(
         Hex color string for the turnpoint.
     """
     if is_goal:
-        return "#ff0000"  # Red for goal
+        return _GOAL_COLOR
+    return _TURNPOINT_COLORS.get(turnpoint_type, _DEFAULT_COLOR)
+
+
+def _circle_vertices(
+    center_lat: float, center_lon: float, radius_meters: float
+) -> Iterator[tuple[float, float]]:
+    """Yield the (longitude, latitude) vertices of a circular zone.
 
-    color_mapping = {
-        TurnpointType.TAKEOFF: "#204d74",  # Dark blue
-        TurnpointType.SSS: "#ac2925",  # Dark red
-        TurnpointType.ESS: "#ff8c00",  # Orange
-    }
+    Shared projection kernel of the 2D and 3D circle generators.
+    """
+    radius_deg = radius_meters / METERS_PER_DEGREE
+    cos_lat = math.cos(math.radians(center_lat))
 
-    return color_mapping.get(turnpoint_type, "#269abc")  # Default blue
+    for sin_a, cos_a in _UNIT_CIRCLE:
+        yield center_lon + radius_deg * cos_a / cos_lat, center_lat + radius_deg * sin_a
 
 
 def generate_circle_coordinates_2d(
@@ -82,18 +109,7 @@ def generate_circle_coordinates_2d(
     Returns:
         List of (longitude, latitude) tuples forming a circle.
     """
-    coords = []
-    radius_deg = radius_meters / METERS_PER_DEGREE
-
-    for i in range(CIRCLE_POINTS + 1):  # +1 to close the circle
-        angle = 2 * math.pi * i / CIRCLE_POINTS
-        lat = center_lat + radius_deg * math.sin(angle)
-        lon = center_lon + radius_deg * math.cos(angle) / math.cos(
-            math.radians(center_lat)
-        )
-        coords.append((lon, lat))
-
-    return coords
+    return list(_circle_vertices(center_lat, center_lon, radius_meters))
 
 
 def generate_circle_coordinates_3d(
@@ -110,8 +126,10 @@ def generate_circle_coordinates_3d(
     Returns:
         List of (longitude, latitude, altitude) tuples forming a circle.
     """
-    coords_2d = generate_circle_coordinates_2d(center_lat, center_lon, radius_meters)
-    return [(lon, lat, altitude) for lon, lat in coords_2d]
+    return [
+        (lon, lat, altitude)
+        for lon, lat in _circle_vertices(center_lat, center_lon, radius_meters)
+    ]
 
 
 def is_goal_turnpoint(
@@ -133,11 +151,10 @@ def is_goal_turnpoint(
     if task is not None and task.goal is None:
         return False
 
-    try:
-        index = all_turnpoints.index(turnpoint)
-        return index == len(all_turnpoints) - 1
-    except ValueError:
-        return False
+    # Identity, not list.index(): index() is a linear scan using Turnpoint
+    # equality, which also misses the goal when an earlier turnpoint is
+    # equal to it (e.g. an out-and-return task ending at the start cylinder).
+    return bool(all_turnpoints) and turnpoint is all_turnpoints[-1]
 
 
 def get_route_coordinates_with_fallback(
@@ -152,6 +169,10 @@ def get_route_coordinates_with_fallback(
     Returns:
         List of (lat, lon) coordinate tuples for the route.
     """
+    # A route needs two turnpoints; don't build the optimizer inputs otherwise
+    if len(task.turnpoints) < 2:
+        return fallback_coordinates
+
     opt_route_coords = get_optimized_route_coordinates(task)
 
     if opt_route_coords and len(opt_route_coords) >= 2:
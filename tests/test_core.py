@@ -9,6 +9,8 @@ This test suite covers:
 
 """
 
+import dataclasses
+
 import pytest
 
 from pyxctsk import (
@@ -30,6 +32,7 @@ from pyxctsk import (
     Waypoint,
     parse_task,
 )
+from pyxctsk import task as task_module
 from pyxctsk.shared_enums import InvalidTimeOfDayError
 
 
@@ -53,6 +56,27 @@ class TestTimeOfDay:
         assert parsed_time.minute == 30
         assert parsed_time.second == 45
 
+        # Identical times parse to one shared (immutable) instance
+        assert TimeOfDay.from_json_string('"10:30:45Z"') is parsed_time
+
+    def test_fields_unaffected_by_rendering(self):
+        """Test that rendering the string leaves the dataclass fields alone."""
+        time = TimeOfDay(hour=10, minute=0, second=0)
+        assert str(time) == "10:00:00Z"
+        assert dataclasses.asdict(time) == {"hour": 10, "minute": 0, "second": 0}
+
+    def test_subclass_parsing(self):
+        """Test that parsing through a subclass returns a subclass instance."""
+
+        class LocalTime(TimeOfDay):
+            pass
+
+        base = TimeOfDay.from_json_string("08:15:00Z")
+        local = LocalTime.from_json_string("08:15:00Z")
+        assert type(base) is TimeOfDay
+        assert type(local) is LocalTime
+        assert (local.hour, local.minute, local.second) == (8, 15, 0)
+
     def test_validation(self):
         """Test TimeOfDay validation."""
         # Test valid edge cases
@@ -79,6 +103,10 @@ class TestTimeOfDay:
         with pytest.raises(InvalidTimeOfDayError):
             TimeOfDay.from_json_string('"invalid"')
 
+        for malformed in ("1:00:00Z", "10:00:00", "10-00-00Z", "10:0a:00Z", ""):
+            with pytest.raises(InvalidTimeOfDayError):
+                TimeOfDay.from_json_string(malformed)
+
 
 class TestWaypoint:
     """Waypoint functionality tests."""
@@ -109,6 +137,10 @@ class TestWaypoint:
         assert parsed_waypoint.alt_smoothed == waypoint.alt_smoothed
         assert parsed_waypoint.description == waypoint.description
 
+        # An empty description is omitted entirely
+        bare = Waypoint(name="Bare", lat=46.5, lon=8.0, alt_smoothed=1000)
+        assert list(bare.to_dict()) == ["name", "lat", "lon", "altSmoothed"]
+
 
 class TestTaskSerialization:
     """Task JSON serialization and parsing tests."""
@@ -181,6 +213,101 @@ class TestTaskSerialization:
         assert task.version == 1
         assert len(task.turnpoints) == 1
 
+    def test_non_ascii_json_roundtrip(self):
+        """Test that non-ASCII names are escaped and survive a JSON roundtrip."""
+        task = Task(
+            task_type=TaskType.CLASSIC,
+            version=1,
+            turnpoints=[
+                Turnpoint(
+                    radius=400,
+                    waypoint=Waypoint(
+                        name="Grüsch", lat=46.98, lon=9.64, alt_smoothed=628
+                    ),
+                )
+            ],
+        )
+
+        json_str = task.to_json()
+        assert " " not in json_str
+        assert json_str.isascii()
+        assert Task.from_json(json_str).to_dict() == task.to_dict()
+
+    def test_from_json_independent_of_orjson(self, monkeypatch):
+        """Test the stdlib fallback parses the same task as orjson."""
+        pytest.importorskip("orjson")
+        task = Task(
+            task_type=TaskType.CLASSIC,
+            version=1,
+            turnpoints=[
+                Turnpoint(
+                    radius=400,
+                    waypoint=Waypoint(
+                        name="Grüsch", lat=51.48, lon=1e-05, alt_smoothed=628
+                    ),
+                    type=TurnpointType.SSS,
+                )
+            ],
+            goal=Goal(deadline=TimeOfDay(hour=17, minute=0, second=0)),
+        )
+        json_str = task.to_json()
+
+        with_orjson = Task.from_json(json_str).to_dict()
+        monkeypatch.setattr(task_module, "orjson", None)
+        assert Task.from_json(json_str).to_dict() == with_orjson
+        assert task.to_json() == json_str
+
+
+class TestTaskEss:
+    """ESS lookup tests."""
+
+    @staticmethod
+    def _task(types):
+        return Task(
+            task_type=TaskType.CLASSIC,
+            version=1,
+            turnpoints=[
+                Turnpoint(
+                    radius=1000,
+                    waypoint=Waypoint(name="TP", lat=46.5, lon=8.0, alt_smoothed=1000),
+                    type=tp_type,
+                )
+                for tp_type in types
+            ],
+        )
+
+    def test_ess_is_goal(self):
+        """Test an ESS on the last turnpoint is reported as the goal."""
+        task = self._task([TurnpointType.SSS, None, TurnpointType.ESS])
+        assert task.find_ess_turnpoint() is task.turnpoints[-1]
+        assert task.is_ess_goal()
+
+    def test_ess_before_goal(self):
+        """Test an ESS before an identical-looking goal is not the goal."""
+        task = self._task([TurnpointType.SSS, TurnpointType.ESS, None])
+        assert task.find_ess_turnpoint() is task.turnpoints[1]
+        assert not task.is_ess_goal()
+
+    def test_plain_string_types(self):
+        """Test plain string values still match their str-enum members."""
+        task = self._task(["SSS", None, "ESS"])
+        assert task.find_ess_turnpoint() is task.turnpoints[-1]
+
+        line_task = Task(
+            task_type=TaskType.CLASSIC,
+            version=1,
+            turnpoints=task.turnpoints,
+            goal=Goal(type="LINE"),  # type: ignore[arg-type]
+        )
+        assert line_task.goal is not None
+        assert line_task.goal.line_length == 2000.0
+
+    def test_no_ess(self):
+        """Test tasks without an ESS."""
+        assert self._task([None, None]).find_ess_turnpoint() is None
+        assert not self._task([None, None]).is_ess_goal()
+        assert not self._task([]).is_ess_goal()
+
 
 class TestTaskParsing:
     """Task parsing from various input formats."""
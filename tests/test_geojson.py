@@ -84,6 +84,25 @@ class TestCreateTurnpointFeature:
 
         assert feature["properties"]["color"] == "#ff0000"  # goal color (red)
 
+    def test_create_turnpoint_feature_goal_equal_to_start(self):
+        """Test the goal is detected when it equals an earlier turnpoint."""
+        waypoint = Waypoint(name="Launch", lat=46.5, lon=8.0, alt_smoothed=1000)
+        start = Turnpoint(radius=400, waypoint=waypoint, type=TurnpointType.NONE)
+        finish = Turnpoint(radius=400, waypoint=waypoint, type=TurnpointType.NONE)
+        all_turnpoints = [start, finish]
+        task = Task(
+            task_type=TaskType.CLASSIC,
+            version=1,
+            turnpoints=all_turnpoints,
+            goal=Goal(type=GoalType.CYLINDER),
+        )
+
+        start_feature = _create_turnpoint_feature(start, 0, all_turnpoints, task)
+        finish_feature = _create_turnpoint_feature(finish, 1, all_turnpoints, task)
+
+        assert start_feature["properties"]["color"] == "#269abc"
+        assert finish_feature["properties"]["color"] == "#ff0000"
+
     def test_create_turnpoint_feature_default(self):
         """Test creating turnpoint feature with default type."""
         waypoint = Waypoint(name="TP1", lat=46.5, lon=8.0, alt_smoothed=1000)
@@ -7,6 +7,8 @@ This module verifies:
 - Compatibility with various Task and Turnpoint configurations
 """
 
+import re
+
 from pyxctsk import (
     Task,
     TaskType,
@@ -203,3 +205,31 @@ class TestTaskToKML:
         assert "<Style" in kml_result  # simplekml generates styles
         assert "<outerBoundaryIs>" in kml_result  # polygon boundary
         assert "<LinearRing" in kml_result  # polygon ring
+
+    def test_task_to_kml_shared_styles(self):
+        """Test that styles are shared and every color is a plain KML color."""
+        task = Task(
+            task_type=TaskType.CLASSIC,
+            version=1,
+            turnpoints=[
+                Turnpoint(
+                    radius=400,
+                    waypoint=Waypoint(
+                        name=f"TP{i}", lat=46.0 + i * 0.1, lon=8.0, alt_smoothed=1000
+                    ),
+                    type=TurnpointType.NONE,
+                )
+                for i in range(4)
+            ],
+        )
+
+        kml_result = task_to_kml(task)
+
+        # Icon colors used to embed a whole <Style> element
+        colors = re.findall(r"<color>(.*?)</color>", kml_result, re.DOTALL)
+        assert colors
+        assert all(re.fullmatch(r"[0-9a-fA-F]{8}", color) for color in colors)
+
+        # Three plain turnpoints plus the goal: two polygon styles, two center
+        # styles and the course line style
+        assert kml_result.count("<Style ") == 5
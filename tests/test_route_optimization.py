@@ -16,7 +16,12 @@ from pyxctsk.route_optimization import (
     _polyline_length,
     calculate_iteratively_refined_route,
 )
-from pyxctsk.turnpoint import TaskTurnpoint, TurnpointGeometry, plane_optimal_point
+from pyxctsk.turnpoint import (
+    TaskTurnpoint,
+    TurnpointGeometry,
+    distance_through_centers,
+    plane_optimal_point,
+)
 
 
 @dataclass
@@ -28,6 +33,11 @@ class FakeTurnpoint:
     goal_type: str | None = None
 
 
+def _via_length(prev, point, nxt):
+    """Length of the path prev -> point -> nxt."""
+    return math.dist(prev, point) + math.dist(point, nxt)
+
+
 def test_fake_turnpoint_satisfies_protocol():
     """FakeTurnpoint and TaskTurnpoint should satisfy the TurnpointGeometry seam."""
     assert isinstance(FakeTurnpoint((0.0, 0.0)), TurnpointGeometry)
@@ -76,23 +86,30 @@ class TestPlaneOptimalPoint:
         # By symmetry about the x-axis the optimum lies on it.
         assert p[0] == pytest.approx(5.0, abs=1e-6)
 
-    def test_optimum_is_boundary_minimum(self):
-        """The returned point must beat every sampled boundary point."""
-        prev, nxt, center, radius = (-7.0, 3.0), (9.0, 6.0), (1.0, -2.0), 4.0
-
-        def total(point):
-            return math.hypot(point[0] - prev[0], point[1] - prev[1]) + math.hypot(
-                point[0] - nxt[0], point[1] - nxt[1]
-            )
-
+    @pytest.mark.parametrize(
+        "prev, nxt, center, radius",
+        [
+            # Generic reflection case
+            ((-7.0, 3.0), (9.0, 6.0), (1.0, -2.0), 4.0),
+            # Both just inside the boundary: two shallow minima centimeters apart
+            ((527.2, -849.1), (396.6, -917.9), (0.0, 0.0), 1000.0),
+            # Neighbours on the center or along an axis (scan directions)
+            ((900.0, 0.0), (0.0, 500.0), (0.0, 0.0), 1000.0),
+            ((0.0, 0.0), (0.0, 500.0), (0.0, 0.0), 1000.0),
+            ((0.0, 0.0), (900.0, 0.0), (0.0, 0.0), 1000.0),
+        ],
+    )
+    def test_optimum_is_boundary_minimum(self, prev, nxt, center, radius):
+        """The returned point must beat every densely sampled boundary point."""
         best = plane_optimal_point(prev, nxt, center, radius)
-        for k in range(720):
-            theta = math.pi * k / 360.0
+        best_total = _via_length(prev, best, nxt)
+        for k in range(3600):
+            theta = math.pi * k / 1800.0
             sample = (
                 center[0] + radius * math.cos(theta),
                 center[1] + radius * math.sin(theta),
             )
-            assert total(best) <= total(sample) + 1e-6
+            assert best_total <= _via_length(prev, sample, nxt) + 1e-6
 
 
 class TestClosestCirclePoint:
@@ -169,6 +186,18 @@ def test_route_through_fake_turnpoints():
     assert route[-1] == (47.0, 8.2)
 
 
+def test_center_only_route():
+    """Zero-radius turnpoints and a goal line route straight through centers."""
+    turnpoints = [
+        FakeTurnpoint((47.0, 8.0), radius=400.0),
+        FakeTurnpoint((47.1, 8.1)),
+        FakeTurnpoint((47.0, 8.2), goal_type="LINE"),
+    ]
+    distance, route = calculate_iteratively_refined_route(turnpoints)
+    assert route == [tp.center for tp in turnpoints]
+    assert distance == pytest.approx(distance_through_centers(turnpoints))
+
+
 def test_short_input_handling():
     """Fewer than two turnpoints yields a zero distance and pass-through path."""
     assert calculate_iteratively_refined_route([]) == (0.0, [])